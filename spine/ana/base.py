@@ -172,6 +172,19 @@ class AnaBase(ABC):
         """
         self.writers[name].append({**self.base_dict, **kwargs})
 
+    def append_many(self, name, rows):
+        """Apppend a CSV log file with multiple rows of values at once.
+
+        Parameters
+        ----------
+        name : str
+            Name of the writer
+        rows : List[dict]
+            List of dictionaries of information to save to the writer
+        """
+        self.writers[name].append_many(
+                [{**self.base_dict, **row} for row in rows])
+
     def __call__(self, data, entry=None):
         """Runs the analysis script on one entry.
 
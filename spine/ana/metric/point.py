@@ -105,12 +105,15 @@ class PointProposalAna(AnaBase):
             # If there are no target points, record no match
             if not len(points[target]):
                 # Append dummy values
-                dummy = {**self.dummy_dict}
+                rows = []
                 for i in range(len(points[source])):
+                    dummy = {**self.dummy_dict}
                     dummy['shape'] = types[source][i]
                     if self.endpoints:
                         dummy['end'] = ends[source][i]
-                    self.append(f'{source}_to_{target}', **dummy)
+                    rows.append(dummy)
+
+                self.append_many(f'{source}_to_{target}', rows)
 
                 # Proceed
                 continue
@@ -119,6 +122,7 @@ class PointProposalAna(AnaBase):
             dists = dist_mat[source]
             closest_index = np.argmin(dists, axis=1)
             masks = [np.where(types[target] == s)[0] for s in range(self.num_classes)]
+            rows = []
             for i in range(len(points[source])):
                 point_dict = {**self.dummy_dict}
                 point_dict['dist'] = dists[i, closest_index[i]]
@@ -131,4 +135,6 @@ class PointProposalAna(AnaBase):
                     if len(masks[s]) > 0:
                         point_dict[f'dist_{s}'] = np.min(dists[i, masks[s]])
 
-                self.append(f'{source}_to_{target}', **point_dict)
+                rows.append(point_dict)
+
+            self.append_many(f'{source}_to_{target}', rows)
@@ -141,12 +141,15 @@ class SegmentAna(AnaBase):
         # Store the information
         if not self.summary:
             # Store one row per pixel in the image, including pixel scores
+            rows = []
             for i in range(len(seg_label)):
                 row_dict = {'label': seg_label[i], 'pred': seg_pred[i]}
                 for s in range(self.num_classes):
                     row_dict[f'score_{s}'] = seg_scores[i, s]
 
-                self.append('pixel', **row_dict)
+                rows.append(row_dict)
+
+            self.append_many('pixel', rows)
 
         else:
             # Store a summary of the confusion per entry (confusion matrix counts)
@@ -1,9 +1,7 @@
+import math
 from collections import defaultdict
 from itertools import combinations
 
-import numpy as np
-
-from analysis.post_processing.reconstruction.utils import closest_distance_two_lines
 from spine.utils.gnn.cluster import cluster_direction
 
 # TODO: Need to refactor according to post processing conventions
@@ -12,14 +10,14 @@ def _tag_neutral_pions_true(particles):
     out = []
     tagged = defaultdict(list)
     for part in particles:
-        num_voxels_noghost = part.coords_noghost.shape[0]
-        ancestor = part.ancestor_track_id
-        if part.pdg_code == 22 \
-            and part.creation_process == "Decay" \
-            and part.parent_creation_process == "primary" \
-            and part.ancestor_pdg_code = 111 \
-            and num_voxels_noghost > 0:
-            tagged[ancestor].append(part.id)
+        # Reject on the cheap scalar attributes before touching the voxels
+        if part.pdg_code != 22 \
+            or part.ancestor_pdg_code != 111 \
+            or part.creation_process != "Decay" \
+            or part.parent_creation_process != "primary":
+            continue
+        if part.coords_noghost.shape[0] > 0:
+            tagged[part.ancestor_track_id].append(part.id)
     for photon_list in tagged.values():
         out.append(tuple(photon_list))
     return out
@@ -27,10 +25,13 @@ def _tag_neutral_pions_true(particles):
 def _tag_neutral_pions_reco(particles, threshold=5):
     out = []
     photons = [p for p in particles if p.pid == 0]
-    for entry in combinations(photons, 2):
-        p1, p2 = entry
-        v1, v2 = cluster_direction(p1), cluster_direction(p2)
-        d = closest_distance_two_lines(p1.startpoint, v1, p2.startpoint, v2)
+
+    # Estimate the direction of each photon once, rather than once per pair
+    dirs = [cluster_direction(p) for p in photons]
+    for i, j in combinations(range(len(photons)), 2):
+        p1, p2 = photons[i], photons[j]
+        d = closest_distance_two_lines(
+                p1.startpoint, dirs[i], p2.startpoint, dirs[j])
         if d < threshold:
             out.append((p1.id, p2.id))
     return out
@@ -50,22 +51,33 @@ def closest_distance_two_lines(a0, u0, a1, u1):
     a0, u0: point (a0) and unit vector (u0) defining line 1
     a1, u1: point (a1) and unit vector (u1) defining line 2
     """
-    cross = np.cross(u0, u1)
+    # Unpack the 3-vectors, the NumPy call overhead dwarfs the arithmetic
+    a0x, a0y, a0z = a0
+    u0x, u0y, u0z = u0
+    a1x, a1y, a1z = a1
+    u1x, u1y, u1z = u1
+    dx, dy, dz = a1x - a0x, a1y - a0y, a1z - a0z
+
+    cx = u0y*u1z - u0z*u1y
+    cy = u0z*u1x - u0x*u1z
+    cz = u0x*u1y - u0y*u1x
+    cross_sq = cx*cx + cy*cy + cz*cz
+
     # if the cross product is zero, the lines are parallel
-    if np.linalg.norm(cross) == 0:
+    if cross_sq == 0:
         # use any point on line A and project it onto line B
-        t = np.dot(a1 - a0, u1)
-        a = a1 + t * u1 # projected point
+        t = dx*u1x + dy*u1y + dz*u1z
+        ex, ey, ez = dx + t*u1x, dy + t*u1y, dz + t*u1z # projected point - a0
 
-        return np.linalg.norm(a0 - a)
+        return math.sqrt(ex*ex + ey*ey + ez*ez)
     else:
         # use the formula from https://en.wikipedia.org/wiki/Skew_lines#Distance
-        t = np.dot(np.cross(a1 - a0, u1), cross) / np.linalg.norm(cross)**2
-
-        # closest point on line A to line B
-        p = a0 + t * u0
+        t = ((dy*u1z - dz*u1y)*cx
+             + (dz*u1x - dx*u1z)*cy
+             + (dx*u1y - dy*u1x)*cz) / cross_sq
 
-        # closest point on line B to line A
-        q = p - cross * np.dot(p - a1, cross) / np.linalg.norm(cross)**2
+        # closest point on line A to line B, relative to a1
+        px, py, pz = t*u0x - dx, t*u0y - dy, t*u0z - dz
 
-        return np.linalg.norm(p - q) # distance between p and q
+        # distance to the closest point on line B to line A
+        return abs(px*cx + py*cy + pz*cz) / math.sqrt(cross_sq)
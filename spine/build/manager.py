@@ -1,6 +1,6 @@
 """Class to build all require representations."""
 
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 
 import numpy as np
 
@@ -11,6 +11,13 @@ from .fragment import FragmentBuilder
 from .particle import ParticleBuilder
 from .interaction import InteractionBuilder
 
+# If the coordinate columns are contiguous, use a slice to fetch them. Basic
+# slicing returns a view of the tensor, fancy indexing makes a copy
+if np.array_equal(COORD_COLS, np.arange(COORD_COLS[0], COORD_COLS[-1] + 1)):
+    _COORD_SLICE = slice(int(COORD_COLS[0]), int(COORD_COLS[-1]) + 1)
+else:
+    _COORD_SLICE = COORD_COLS
+
 
 class BuildManager:
     """Manager which constructs data representations based on the chain output.
@@ -59,18 +66,22 @@ class BuildManager:
         self.units = units
         
         # Parse the build sources based on defaults
+        source_map = dict(self.sources)
         if sources is not None:
             for key, value in sources.items():
                 assert key in self.sources, (
                          "Unexpected data product specified in `sources`: "
                         f"{key}. Should be one of {list(self.sources.keys())}.")
-            self.sources.update(**sources)
+            source_map.update(**sources)
+
+        # Freeze the sources into an ordered tuple of (key, alternatives)
+        self.sources = tuple(
+                (key, (value,) if isinstance(value, str) else tuple(value))
+                for key, value in source_map.items())
 
-        for key, value in self.sources.items():
-            if isinstance(value, str):
-                self.sources[key] = [value]
-            else:
-                self.sources[key] = value
+        # Cache of the source names found in the data, resolved on first call
+        self._resolved = None
+        self._resolved_signature = None
 
         # Initialize the builders
         self.builders = OrderedDict()
@@ -100,41 +111,29 @@ class BuildManager:
         -----
         Modifies the data dictionary in place.
         """
+        # Check once whether this is a single entry or a batch of entries
+        entries = None
+        if not np.isscalar(data['index']):
+            entries = range(len(data['index']))
+
         # If this is the first time the builders are called, build
         # the objects shared between fragments/particles/interactions
         load = True
         if 'points' not in data:
             load = False
-            if np.isscalar(data['index']):
-                sources = self.build_sources(data)
-            else:
-                sources = defaultdict(list)
-                for entry in range(len(data['index'])):
-                    sources_e = self.build_sources(data, entry)
-                    for key, val in sources_e.items():
-                        sources[key].append(val)
-
-            data.update(**sources)
+            data.update(**self.build_sources(data, entries))
 
         # Loop over builders
+        load_matches = load and self.mode in ['both', 'all']
         for name, builder in self.builders.items():
             # Build representations
             builder(data)
 
             # Generate match pairs from stored matches
-            if load and self.mode in ['both', 'all']:
-                if np.isscalar(data['index']):
-                    match_dict = self.load_match_pairs(data, name)
-                else:
-                    match_dict = defaultdict(list)
-                    for entry in range(len(data['index'])):
-                        match_dict_e = self.load_match_pairs(data, name, entry)
-                        for key, val in match_dict_e.items():
-                            match_dict[key].append(val)
-
-                data.update(**match_dict)
-
-    def build_sources(self, data, entry=None):
+            if load_matches:
+                data.update(**self.load_match_pairs(data, name, entries))
+
+    def build_sources(self, data, entries=None):
         """Construct the reference coordinate and value tensors used by
         all the representations built by the module.
 
@@ -145,27 +144,74 @@ class BuildManager:
         ----------
         data : dict
             Dictionary of input data and model outputs
+        entries : List[int], optional
+            Entries to build the sources for. If not specified, the data
+            dictionary is assumed to contain a single entry
+
+        Returns
+        -------
+        dict
+            Dictionary of sources. If `entries` is specified, each value is
+            a list with one element per entry
+        """
+        # Resolve the names of the sources once for the whole batch
+        resolved = self.resolve_sources(data)
+        if entries is None:
+            return self._build_entry_sources(data, resolved)
+
+        # If all entries share the same metadata, convert the point
+        # coordinates of the whole batch at once
+        shared_meta = (self.units != 'px' and 'meta' in data
+                       and self.is_shared_meta(data['meta']))
+        result = self._collect_entries(
+                (self._build_entry_sources(
+                    data, resolved, entry, convert_points=not shared_meta)
+                 for entry in entries), len(entries))
+
+        if shared_meta:
+            meta = data['meta'][0]
+            for key, val in result.items():
+                if 'points' in key:
+                    result[key] = self.batch_to_cm(val, meta)
+
+        return result
+
+    def _build_entry_sources(self, data, resolved, entry=None,
+                             convert_points=True):
+        """Construct the reference coordinate and value tensors of one entry.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary of input data and model outputs
+        resolved : Tuple[Tuple[str, str]]
+            (key, name) pairs for each of the sources found in the data
         entry : int, optional
             Entry number
+        convert_points : bool, default True
+            If `False`, leave the point coordinates in pixel units (used when
+            converting the whole batch at once)
+
+        Returns
+        -------
+        dict
+            Dictionary of sources for this entry
         """
         # Fetch the orginal sources
         sources = {}
-        for key, alt_keys in self.sources.items():
-            for alt in alt_keys:
-                if alt in data:
-                    sources[key] = data[alt]
-                    if entry is not None:
-                        sources[key] = data[alt][entry]
-                    break
+        for key, alt in resolved:
+            sources[key] = data[alt]
+            if entry is not None:
+                sources[key] = data[alt][entry]
 
         # Build aditional information
         update = {}
-        update['points'] = sources['data_tensor'][:, COORD_COLS]
+        update['points'] = sources['data_tensor'][:, _COORD_SLICE]
         update['depositions'] = sources['data_tensor'][:, VALUE_COL]
         
         if self.mode != 'reco':
             update['label_tensor'] = sources['label_tensor']
-            update['points_label'] = sources['label_tensor'][:, COORD_COLS]
+            update['points_label'] = sources['label_tensor'][:, _COORD_SLICE]
             update['depositions_label'] = sources['label_tensor'][:, VALUE_COL]
 
             update['label_adapt_tensor'] = sources['label_adapt_tensor']
@@ -178,13 +224,16 @@ class BuildManager:
 
         if 'label_g4_tensor' in sources:
             update['label_g4_tensor'] = sources['label_g4_tensor']
-            update['points_g4'] = sources['label_g4_tensor'][:, COORD_COLS]
+            update['points_g4'] = sources['label_g4_tensor'][:, _COORD_SLICE]
             update['depositions_g4'] = sources['label_g4_tensor'][:, VALUE_COL]
 
+        # The sources are (module ID, TPC ID) pairs, 32 bits are plenty
         if 'sources' in sources:
-            update['sources'] = sources['sources'].astype(int)
+            update['sources'] = sources['sources'].astype(
+                    np.int32, copy=False)
         if 'sources_label' in sources:
-            update['sources_label'] = sources['sources_label'].astype(int)
+            update['sources_label'] = sources['sources_label'].astype(
+                    np.int32, copy=False)
 
         # If provided, etch the point attributes to check their units
         for obj in ['fragment', 'particle']:
@@ -201,11 +250,11 @@ class BuildManager:
                     "Must provide metadata to build objects in cm.")
 
             meta = data['meta'][entry] if entry is not None else data['meta']
-            for key in update:
-                if 'points' in key and key in update:
-                    if key in update:
-                        update[key] = meta.to_cm(
-                                np.copy(update[key]), center=True)
+            if convert_points:
+                # The conversion allocates its output, no need to copy
+                for key in update:
+                    if 'points' in key:
+                        update[key] = meta.to_cm(update[key], center=True)
 
             for key in ['particles', 'neutrinos']:
                 if key in sources:
@@ -216,10 +265,140 @@ class BuildManager:
 
         return update
 
+    def resolve_sources(self, data):
+        """Finds the name under which each source is stored in the data.
+
+        The resolution is cached and only recomputed when the set of data
+        products provided changes.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary of input data and model outputs
+
+        Returns
+        -------
+        Tuple[Tuple[str, str]]
+            (key, name) pairs for each of the sources found in the data
+        """
+        signature = frozenset(data)
+        if signature != self._resolved_signature:
+            resolved = []
+            for key, alt_keys in self.sources:
+                for alt in alt_keys:
+                    if alt in data:
+                        resolved.append((key, alt))
+                        break
+
+            self._resolved = tuple(resolved)
+            self._resolved_signature = signature
+
+        return self._resolved
+
+    @staticmethod
+    def is_shared_meta(metas):
+        """Checks whether all the entries in a batch share the same metadata.
+
+        Parameters
+        ----------
+        metas : List[Meta]
+            List of metadata objects, one per entry
+
+        Returns
+        -------
+        bool
+            `True` if all the entries have the same image boundaries
+            and pixel size
+        """
+        if not len(metas):
+            return False
+
+        ref = metas[0]
+        for meta in metas[1:]:
+            if (not np.array_equal(meta.lower, ref.lower) or
+                not np.array_equal(meta.size, ref.size)):
+                return False
+
+        return True
+
+    @staticmethod
+    def batch_to_cm(points, meta):
+        """Converts the pixel coordinates of all entries in a batch to
+        detector coordinates in cm with a single conversion call.
+
+        Parameters
+        ----------
+        points : List[np.ndarray]
+            (B) List of (N_b, 3) pixel coordinates, one per entry
+        meta : Meta
+            Metadata shared by all the entries in the batch
+
+        Returns
+        -------
+        List[np.ndarray]
+            (B) List of (N_b, 3) coordinates in cm, one per entry
+        """
+        offsets = np.cumsum([len(p) for p in points])[:-1]
+        points_cm = meta.to_cm(np.concatenate(points), center=True)
+
+        return np.split(points_cm, offsets)
+
     @staticmethod
-    def load_match_pairs(data, name, entry=None):
+    def _collect_entries(updates, num_entries):
+        """Gathers per-entry dictionaries into a dictionary of lists.
+
+        Parameters
+        ----------
+        updates : Iterable[dict]
+            One dictionary of products per entry
+        num_entries : int
+            Number of entries
+
+        Returns
+        -------
+        dict
+            Dictionary of lists with one element per entry
+        """
+        result = {}
+        for i, update in enumerate(updates):
+            if i == 0:
+                result = {key: [None]*num_entries for key in update}
+            for key, val in update.items():
+                result[key][i] = val
+
+        return result
+
+    @classmethod
+    def load_match_pairs(cls, data, name, entries=None):
         """Generate lists of matched object pairs from stored matches.
 
+        Parameters
+        ----------
+        data : dict
+            Dictionary of input data and model outputs
+        name : str
+            Object type name
+        entries : List[int], optional
+            Entries to load the match pairs for. If not specified, the data
+            dictionary is assumed to contain a single entry
+
+        Returns
+        -------
+        dict
+            Dictionary of match pairs and overlaps. If `entries` is specified,
+            each value is a list with one element per entry
+        """
+        if entries is None:
+            return cls._load_entry_match_pairs(data, name)
+
+        return cls._collect_entries(
+                (cls._load_entry_match_pairs(data, name, entry)
+                 for entry in entries), len(entries))
+
+    @staticmethod
+    def _load_entry_match_pairs(data, name, entry=None):
+        """Generate lists of matched object pairs of one entry.
+
         Parameters
         ----------
         data : dict
@@ -228,6 +407,11 @@ class BuildManager:
             Object type name
         entry : int, optional
             Entry number
+
+        Returns
+        -------
+        dict
+            Dictionary of match pairs and overlaps for this entry
         """
         # Initialize the name of the match lists
         prefix = f'{name}_matches'
@@ -245,18 +429,14 @@ class BuildManager:
             suffix = f'{source[0]}2{target[0]}'
             match_key = f'{prefix}_{suffix}'
             match_overlap_key = f'{match_key}_overlap'
-            result[match_key] = []
-            result[match_overlap_key] = []
-            for obj in sources:
-                if not obj.is_matched:
-                    # If no match is found, give an empty value to the match
-                    result[match_key].append((obj, None))
-                    result[match_overlap_key].append(-1.)
-
-                else:
-                    # If a match is found, the first is always the best match
-                    best_match = obj.match_ids[0]
-                    result[match_key].append((obj, targets[best_match]))
-                    result[match_overlap_key].append(obj.match_overlaps[0])
+            # If a match is found, the first is always the best match. If no
+            # match is found, give an empty value to the match
+            matched = [obj.is_matched for obj in sources]
+            result[match_key] = [
+                    (obj, targets[obj.match_ids[0]] if m else None)
+                    for obj, m in zip(sources, matched)]
+            result[match_overlap_key] = [
+                    obj.match_overlaps[0] if m else -1.
+                    for obj, m in zip(sources, matched)]
 
         return result
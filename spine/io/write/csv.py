@@ -81,39 +81,67 @@ class CSVWriter:
         result_blob : dict
             Dictionary containing the output of the reconstruction chain
         """
-        # Fetch the values to store
+        self.append_many([result_blob])
+
+    def append_many(self, result_blobs):
+        """Append the CSV file with multiple rows at once.
+
+        This opens the file only once for all the rows provided.
+
+        Parameters
+        ----------
+        result_blobs : List[dict]
+            List of dictionaries, each containing one row of output
+        """
+        # If there is nothing to write, nothing to do
+        if not len(result_blobs):
+            return
+
+        # If this function has never been called, initialiaze the CSV file
         if self.result_keys is None:
-            # If this function has never been called, initialiaze the CSV file
-            self.create(result_blob)
-
-        else:
-            # If it has, check that the list of keys is identical
-            if list(result_blob.keys()) != self.result_keys:
-                # If it is not identical, check the discrepancies
-                missing = self.array_diff(self.result_keys, result_blob.keys())
-                excess  = self.array_diff(result_blob.keys(), self.result_keys)
-                if len(excess):
-                    raise AssertionError(
-                             "There are keys in this entry which were not "
-                             "present when the CSV file was initialized. "
-                            f"New keys: {list(excess)}")
-
-                if not self.accept_missing:
-                    raise AssertionError(
-                             "There are keys missing in this entry which were "
-                             "present when the CSV file was initialized. "
-                            f"Missing keys: {list(missing)}")
-
-                new_result_blob = {k:-1 for k in self.result_keys}
-                for k, v in result_blob.items():
-                    new_result_blob[k] = v
-                result_blob = new_result_blob
-
-        # Append file
+            self.create(result_blobs[0])
+
+        # Format the rows and append them to the file in one go
+        rows = [self.format_row(blob) for blob in result_blobs]
         with open(self.file_name, 'a', encoding='utf-8') as out_file:
-            result_str = ','.join(
-                    [str(result_blob[k]) for k in self.result_keys])
-            out_file.write(result_str + '\n')
+            out_file.write('\n'.join(rows) + '\n')
+
+    def format_row(self, result_blob):
+        """Converts one row of output into a CSV line.
+
+        Parameters
+        ----------
+        result_blob : dict
+            Dictionary containing one row of output
+
+        Returns
+        -------
+        str
+            Comma-separated values, in the order of the file header
+        """
+        # Check that the list of keys is identical to the header
+        if list(result_blob.keys()) != self.result_keys:
+            # If it is not identical, check the discrepancies
+            missing = self.array_diff(self.result_keys, result_blob.keys())
+            excess  = self.array_diff(result_blob.keys(), self.result_keys)
+            if len(excess):
+                raise AssertionError(
+                         "There are keys in this entry which were not "
+                         "present when the CSV file was initialized. "
+                        f"New keys: {list(excess)}")
+
+            if not self.accept_missing:
+                raise AssertionError(
+                         "There are keys missing in this entry which were "
+                         "present when the CSV file was initialized. "
+                        f"Missing keys: {list(missing)}")
+
+            new_result_blob = {k:-1 for k in self.result_keys}
+            for k, v in result_blob.items():
+                new_result_blob[k] = v
+            result_blob = new_result_blob
+
+        return ','.join([str(result_blob[k]) for k in self.result_keys])
 
     @staticmethod
     def array_diff(array_x, array_y):
@@ -155,7 +155,7 @@ class PostBase(ABC):
         # Store the parent path
         self.parent_path = parent_path
 
-    def __call__(self, data, entry=None):
+    def __call__(self, data, entry=None, batch=False):
         """Calls the post processor on one entry.
 
         Parameters
@@ -164,6 +164,8 @@ class PostBase(ABC):
             Dicitionary of data products
         entry : int, optional
             Entry in the batch
+        batch : bool, default False
+            If `True`, feed the whole batch to the `process_batch` method
 
         Returns
         -------
@@ -185,6 +187,9 @@ class PostBase(ABC):
                     data_filter[key] = data[key][entry]
 
         # Run the post-processor
+        if batch:
+            return self.process_batch(data_filter)
+
         return self.process(data_filter)
 
     def get_index(self, obj):
@@ -1,7 +1,7 @@
 """Manages the operation of post-processors."""
 
 from warnings import warn
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 
 import numpy as np
 
@@ -36,6 +36,7 @@ class PostManager:
         # Add the modules to a processor list in decreasing order of priority
         self.watch = StopwatchManager()
         self.modules = OrderedDict()
+        self.batch_modules = set()
         keys = keys[np.argsort(-priorities)]
         for k in keys:
             # Profile the module
@@ -45,6 +46,10 @@ class PostManager:
             self.modules[k] = post_processor_factory(
                     k, cfg[k], parent_path=parent_path)
 
+            # Record modules which can process a whole batch in one call
+            if hasattr(self.modules[k], 'process_batch'):
+                self.batch_modules.add(k)
+
     def __call__(self, data):
         """Pass one batch of data through the post-processors.
 
@@ -55,28 +60,34 @@ class PostManager:
         """
         # Loop over the post-processor modules
         single_entry = np.isscalar(data['index'])
+        num_entries = 1 if single_entry else len(data['index'])
         for key, module in self.modules.items():
             # Run the post-processor on each entry
             self.watch.start(key)
             if single_entry:
                 result = module(data)
 
+            elif key in self.batch_modules:
+                result = module(data, batch=True)
+
             else:
-                num_entries = len(data['index'])
-                result = defaultdict(list)
+                # Allocate the output lists once the first result is known
+                result = None
                 for entry in range(num_entries):
                     result_e = module(data, entry)
                     if result_e is not None:
+                        if result is None:
+                            result = {k: [None]*num_entries for k in result_e}
                         for k, v in result_e.items():
-                           result[k].append(v)
+                            result[k][entry] = v
 
             self.watch.stop(key)
 
             # Update the input dictionary
             if result is not None:
-                for key, val in result.items():
+                for res_key, val in result.items():
                     if not single_entry:
                         assert len(val) == num_entries, (
-                                f"The number {key} ({len(val)}) does not match "
-                                f"the number of entries ({num_entries}).")
-                    data[key] = val
+                                f"The number {res_key} ({len(val)}) does not "
+                                f"match the number of entries ({num_entries}).")
+                    data[res_key] = val
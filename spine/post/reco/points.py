@@ -1,5 +1,7 @@
 """Track end point assignment module."""
 
+from functools import partial
+
 from spine.utils.globals import TRACK_SHP
 from spine.utils.tracking import check_track_orientation
 from spine.utils.ppn import check_track_orientation_ppn
@@ -41,6 +43,18 @@ class TrackExtremaProcessor(PostBase):
         self.method = method
         self.kwargs = kwargs
 
+        # Bind the orientation function once and for all
+        if method in ['local', 'gradient']:
+            self._orient_fn = partial(
+                    check_track_orientation, method=method, **kwargs)
+        elif method == 'ppn':
+            self._orient_fn = check_track_orientation_ppn
+        else:
+            raise ValueError(
+                    f"Point assignment method not recognized: {method}")
+
+        self._needs_ppn = method == 'ppn'
+
     def process(self, data):
         """Assign track end points in one entry
 
@@ -49,29 +63,57 @@ class TrackExtremaProcessor(PostBase):
         data : dict
             Dictionary of data products
         """
-        for part in data['reco_particles']:
-            # Only process track objects
-            if part.shape == TRACK_SHP:
-                # Check if the end points need to be flipped
-                if self.method in ['local', 'gradient']:
-                    flip = not check_track_orientation(
-                            part.points, part.depositions, part.start_point,
-                            part.end_point, self.method, **self.kwargs)
-
-                elif self.method == 'ppn':
-                    assert 'ppn_candidates' in data, (
-                            "Must run the `ppn_points` post-processor "
-                            "before using PPN predictions to assign extrema.")
-                    flip = not check_track_orientation_ppn(
-                            part.start_point, part.end_point,
-                            data['ppn_candidates'])
-
-                else:
-                    raise ValueError(
-                             "Point assignment method not recognized: "
-                            f"{self.method}")
-
-                # If needed, flip en end points
-                if flip:
-                    part.start_point, part.end_point = (
-                            part.end_point, part.start_point)
+        ppn_candidates = data.get('ppn_candidates', None)
+        tracks = [part for part in data['reco_particles']
+                  if part.shape == TRACK_SHP]
+        self.orient_tracks(tracks, [ppn_candidates]*len(tracks))
+
+    def process_batch(self, data):
+        """Assign track end points in all entries of a batch at once
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary of data products for the whole batch
+        """
+        # Flatten the tracks across the batch, keep track of their entry
+        num_entries = len(data['reco_particles'])
+        ppn_candidates = data.get('ppn_candidates', [None]*num_entries)
+        tracks, track_ppn = [], []
+        for entry, particles in enumerate(data['reco_particles']):
+            for part in particles:
+                if part.shape == TRACK_SHP:
+                    tracks.append(part)
+                    track_ppn.append(ppn_candidates[entry])
+
+        self.orient_tracks(tracks, track_ppn)
+
+    def orient_tracks(self, tracks, ppn_candidates):
+        """Assign the end points of a list of tracks
+
+        Parameters
+        ----------
+        tracks : List[RecoParticle]
+            List of track particles
+        ppn_candidates : List[np.ndarray]
+            PPN candidates corresponding to each track
+        """
+        for part, ppn_cands in zip(tracks, ppn_candidates):
+            # Check if the end points need to be flipped
+            if not self._needs_ppn:
+                flip = not self._orient_fn(
+                        part.points, part.depositions, part.start_point,
+                        part.end_point)
+
+            else:
+                assert ppn_cands is not None, (
+                        "Must run the `ppn_points` post-processor "
+                        "before using PPN predictions to assign extrema.")
+                flip = not self._orient_fn(
+                        part.start_point, part.end_point, ppn_cands)
+
+            # If needed, flip en end points
+            if flip:
+                end_point = part.end_point
+                part.end_point = part.start_point
+                part.start_point = end_point
@@ -87,3 +87,9 @@ class TemplateProcessor(PostBase):
 
         # Return an update or override to the current data product dictionary
         return {} # Can have no return as well if objects are edited in place
+
+    # Optionally, define a `process_batch` method which receives the data
+    # products of all the entries in a batch at once (lists of per-entry
+    # products). If it exists, the post-processor manager calls it once per
+    # batch instead of calling `process` once per entry. It must return
+    # either nothing or a dictionary of lists with one value per entry.
@@ -108,35 +108,113 @@ def check_track_orientation(coordinates: nb.float32[:,:],
        if the end point is more likely to be the start point.
     """
     if method == 'local':
-        # If requested, anchor the end points to the closest track points
-        end_points = np.vstack((start_point, end_point))
-        if anchor_points:
-            dist_mat = nbl.cdist(end_points, coordinates)
-            end_ids  = nbl.argmin(dist_mat, axis=1)
-            end_points = coordinates[end_ids]
+        return check_track_orientation_local(
+                coordinates, values, start_point, end_point, local_radius)
 
-        # Compute the local dE/dx around each end, pick the end with the lowest
-        start_dedx  = np.sum(values[dist_mat[0] < local_radius])/local_radius
-        end_dedx    = np.sum(values[dist_mat[1] < local_radius])/local_radius
+    elif method == 'gradient':
+        return check_track_orientation_gradient(
+                coordinates, values, start_point, end_point, anchor_points,
+                segment_method, segment_length, segment_min_count)
 
-        return start_dedx < end_dedx
+    else:
+        raise ValueError('Track orientation method not recognized')
 
-    elif method == 'gradient':
-        # Compute the track gradient with respect to either ends
-        grad_start = get_track_deposition_gradient(coordinates,
-                values, start_point, segment_length, segment_method,
-                anchor_points, segment_min_count)[0]
-        grad_end = get_track_deposition_gradient(coordinates,
-                values, end_point, segment_length, segment_method,
-                anchor_points, segment_min_count)[0]
 
-        # Compute the deposition gradient as an average of the two
-        gradient = (grad_start - grad_end) / 2.
+@nb.njit(cache=True)
+def check_track_orientation_local(coordinates: nb.float32[:,:],
+                                  values: nb.float32[:],
+                                  start_point: nb.float32[:],
+                                  end_point: nb.float32[:],
+                                  local_radius: nb.float32 = 5) -> bool:
+    """Orients a track by comparing the local energy deposition density
+    around each of its end points.
 
-        return bool(gradient >= 0.)
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        (N, 3) Coordinates of the points that make up the track
+    values : np.ndarray
+        (N) Values associated with each point
+    start_point : np.ndarray
+        (3) Start point of the track
+    end_point : np.ndarray
+        (3) End point of the track
+    local_radius : float, default 5
+        Radius around the end points to used to evaluate the local dE/dx
 
-    else:
-        raise ValueError('Track orientation method not recognized')
+    Returns
+    -------
+    bool
+       Returns `True` if the start point provided is correct, `False`
+       if the end point is more likely to be the start point.
+    """
+    # Sum the depositions within the local radius of each end in one pass.
+    # The normalization by the radius is common to both ends, skip it
+    radius_sq = local_radius**2
+    start_dedx, end_dedx = 0., 0.
+    for i in range(len(coordinates)):
+        dist_start, dist_end = 0., 0.
+        for d in range(3):
+            dist_start += (coordinates[i, d] - start_point[d])**2
+            dist_end += (coordinates[i, d] - end_point[d])**2
+        if dist_start < radius_sq:
+            start_dedx += values[i]
+        if dist_end < radius_sq:
+            end_dedx += values[i]
+
+    # Pick the end with the lowest local dE/dx as the start
+    return start_dedx < end_dedx
+
+
+@nb.njit(cache=True)
+def check_track_orientation_gradient(coordinates: nb.float32[:,:],
+                                     values: nb.float32[:],
+                                     start_point: nb.float32[:],
+                                     end_point: nb.float32[:],
+                                     anchor_points: bool = True,
+                                     segment_method: str = 'step_next',
+                                     segment_length: nb.float32 = 5,
+                                     segment_min_count: int = 10) -> bool:
+    """Orients a track based on the overall slope of the energy deposition
+    rate along the track.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        (N, 3) Coordinates of the points that make up the track
+    values : np.ndarray
+        (N) Values associated with each point
+    start_point : np.ndarray
+        (3) Start point of the track
+    end_point : np.ndarray
+        (3) End point of the track
+    anchor_points : bool, default True
+        Weather or not to collapse end point onto the closest track point
+    segment_method : str, default 'step_next'
+        Method used to segment the track
+    segment_length : float, default 5
+        Segment length
+    segment_min_count : int, default 10
+        Minimum number of points in a segment
+
+    Returns
+    -------
+    bool
+       Returns `True` if the start point provided is correct, `False`
+       if the end point is more likely to be the start point.
+    """
+    # Compute the track gradient with respect to either ends
+    grad_start = get_track_deposition_gradient(coordinates,
+            values, start_point, segment_length, segment_method,
+            anchor_points, segment_min_count)[0]
+    grad_end = get_track_deposition_gradient(coordinates,
+            values, end_point, segment_length, segment_method,
+            anchor_points, segment_min_count)[0]
+
+    # Compute the deposition gradient as an average of the two
+    gradient = (grad_start - grad_end) / 2.
+
+    return bool(gradient >= 0.)
 
 
 @nb.njit(cache=True)